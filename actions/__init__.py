@@ -3,10 +3,28 @@ Actions package for APA Stat Scraper
 Contains all CLI actions for the application
 """
 
-from .base import BaseAction
-from .login import LoginAction
-from .verify_session import VerifySessionAction
-from .clear_state import ClearStateAction
-from .extract_player import ExtractPlayerAction
+import importlib
 
-__all__ = ['BaseAction', 'LoginAction', 'VerifySessionAction', 'ClearStateAction', 'ExtractPlayerAction']
+# Map each action class to its submodule so imports happen lazily (PEP 562).
+# Eagerly importing every action pulls in asyncio/playwright on every CLI
+# invocation, even for fast paths like cache-manage that never need them.
+_ACTION_MODULES = {
+    'BaseAction': '.base',
+    'LoginAction': '.login',
+    'VerifySessionAction': '.verify_session',
+    'ClearStateAction': '.clear_state',
+    'ExtractPlayerAction': '.extract_player',
+    'ExtractTeamAction': '.extract_team',
+}
+
+__all__ = ['BaseAction', 'LoginAction', 'VerifySessionAction', 'ClearStateAction', 'ExtractPlayerAction', 'ExtractTeamAction']
+
+
+def __getattr__(name):
+    """Lazily import action classes on first attribute access"""
+    try:
+        module_name = _ACTION_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_name, __name__)
+    return getattr(module, name)
@@ -9,24 +9,34 @@ from logger import logger
 
 class BaseAction(ABC):
     """Base class for all CLI actions"""
-    
+
+    # Actions that never await anything can set this to False to skip
+    # event loop startup entirely and implement _run_sync instead
+    _is_async = True
+
     def __init__(self):
         self.session_manager = APASessionManager()
-    
+
     @abstractmethod
     def run(self, **kwargs):
         """Run the action. Must be implemented by subclasses."""
         pass
-    
+
     async def _run_async(self, **kwargs):
         """Async implementation of the action. Must be implemented by subclasses."""
         pass
-    
+
+    def _run_sync(self, **kwargs):
+        """Sync implementation for actions with _is_async = False."""
+        pass
+
     def _run_with_session(self, **kwargs):
         """Helper method to run async action with session management"""
         try:
             logger.info(f"Starting action: {self.__class__.__name__}")
-            return asyncio.run(self._run_async(**kwargs))
+            if self._is_async:
+                return asyncio.run(self._run_async(**kwargs))
+            return self._run_sync(**kwargs)
         except Exception as e:
             logger.error(f"Error in action {self.__class__.__name__}: {e}")
             print(f"❌ Error in action: {e}")
@@ -5,13 +5,56 @@ Clears browser data, logs, and cache
 
 import os
 import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from .base import BaseAction
 from config import config
 
+# Dirfd-relative syscalls avoid a full path walk per entry; fall back to
+# shutil.rmtree on platforms without dir_fd support
+_SUPPORTS_DIR_FD = (
+    os.open in os.supports_dir_fd
+    and os.unlink in os.supports_dir_fd
+    and os.rmdir in os.supports_dir_fd
+)
+
+
+def _fast_rmtree(path):
+    """Recursively delete a directory tree using dirfd-relative syscalls"""
+    if not _SUPPORTS_DIR_FD:
+        shutil.rmtree(path)
+        return
+
+    fd = os.open(str(path), os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        _fast_rmtree_fd(fd)
+    finally:
+        os.close(fd)
+    os.rmdir(str(path))
+
+
+def _fast_rmtree_fd(dir_fd):
+    """Delete the contents of an open directory fd, recursing into subdirs"""
+    with os.scandir(dir_fd) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                child_fd = os.open(entry.name, os.O_RDONLY | os.O_DIRECTORY, dir_fd=dir_fd)
+                try:
+                    _fast_rmtree_fd(child_fd)
+                finally:
+                    os.close(child_fd)
+                os.rmdir(entry.name, dir_fd=dir_fd)
+            else:
+                os.unlink(entry.name, dir_fd=dir_fd)
+
+
 class ClearStateAction(BaseAction):
     """Action to clear browser state and application data"""
-    
+
+    # Purely filesystem work — no reason to spin up an event loop
+    _is_async = False
+
     def run(self, confirm=False):
         """Run the clear state action"""
         print("🚀 APA Stat Scraper - Clear State")
@@ -20,64 +63,83 @@ class ClearStateAction(BaseAction):
         if not confirm:
             print("⚠️  This will clear all browser data, logs, and cache.")
             print("   You will need to login again after clearing state.")
-            response = input("Are you sure you want to continue? (y/N): ").strip().lower()
+            # Read the reply straight from stdin: input() drags in the
+            # readline module and its tty setup just for one y/N answer
+            sys.stdout.write("Are you sure you want to continue? (y/N): ")
+            sys.stdout.flush()
+            response = sys.stdin.readline().strip().lower()
             if response not in ['y', 'yes']:
                 print("❌ Operation cancelled")
                 return False
         
         return self._run_with_session()
     
-    async def _run_async(self):
-        """Async implementation of clear state"""
+    def _run_sync(self):
+        """Sync implementation of clear state"""
+        # Accumulate progress lines and flush them with one stdout write at
+        # the end instead of a write syscall per print; errors stay immediate
+        out = []
         try:
             var_dir = Path(config.get_var_dir())
-            
+
             if not var_dir.exists():
                 print("ℹ️  No state data found to clear")
                 return True
-            
-            print("��️  Clearing browser data...")
+
             browser_data_dir = var_dir / "browser_data"
-            if browser_data_dir.exists():
-                shutil.rmtree(browser_data_dir)
-                print("   ✅ Browser data cleared")
-            else:
-                print("   ℹ️  No browser data found")
-            
-            print("🗑️  Clearing logs...")
             logs_dir = var_dir / "logs"
-            if logs_dir.exists():
-                shutil.rmtree(logs_dir)
-                print("   ✅ Logs cleared")
-            else:
-                print("   ℹ️  No logs found")
-            
-            print("🗑️  Clearing cache...")
             cache_dir = var_dir / "cache"
-            if cache_dir.exists():
-                shutil.rmtree(cache_dir)
-                print("   ✅ Cache cleared")
-            else:
-                print("   ℹ️  No cache found")
-            
-            print("🗑️  Clearing temporary files...")
             temp_dir = var_dir / "tmp"
-            if temp_dir.exists():
-                shutil.rmtree(temp_dir)
-                print("   ✅ Temporary files cleared")
+
+            targets = [
+                ("browser data", browser_data_dir),
+                ("logs", logs_dir),
+                ("cache", cache_dir),
+                ("temporary files", temp_dir)
+            ]
+
+            # Delete the directory trees in parallel on a thread pool so the
+            # per-file unlink syscalls overlap instead of running serially.
+            # A missing directory surfaces as FileNotFoundError rather than
+            # paying a stat for an up-front existence check
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                pending = []
+                for label, dir_path in targets:
+                    out.append(f"🗑️  Clearing {label}...")
+                    pending.append((label, executor.submit(_fast_rmtree, dir_path)))
+
+                for label, future in pending:
+                    try:
+                        future.result()
+                        out.append(f"   ✅ Cleared {label}")
+                    except FileNotFoundError:
+                        out.append(f"   ℹ️  No {label} found")
+
+            # Recreate necessary directories relative to an open var_dir fd,
+            # one mkdir syscall each instead of Path.mkdir's parent walking
+            out.append("📁 Recreating directory structure...")
+            if os.mkdir in os.supports_dir_fd:
+                var_fd = os.open(str(var_dir), os.O_RDONLY | os.O_DIRECTORY)
+                try:
+                    for name in ('logs', 'cache', 'tmp'):
+                        try:
+                            os.mkdir(name, dir_fd=var_fd)
+                        except FileExistsError:
+                            pass
+                finally:
+                    os.close(var_fd)
             else:
-                print("   ℹ️  No temporary files found")
-            
-            # Recreate necessary directories
-            print("📁 Recreating directory structure...")
-            for dir_path in [logs_dir, cache_dir, temp_dir]:
-                dir_path.mkdir(parents=True, exist_ok=True)
-            
-            print("✅ State cleared successfully!")
-            print("💡 You will need to run 'python app.py login' to re-authenticate")
+                for dir_path in [logs_dir, cache_dir, temp_dir]:
+                    os.makedirs(str(dir_path), exist_ok=True)
             
+            out.append("✅ State cleared successfully!")
+            out.append("💡 You will need to run 'python app.py login' to re-authenticate")
+            sys.stdout.write('\n'.join(out) + '\n')
+
             return True
-            
+
         except Exception as e:
+            if out:
+                sys.stdout.write('\n'.join(out) + '\n')
             print(f"❌ Error clearing state: {e}")
             return False
@@ -4,18 +4,117 @@ Extracts team statistics from a specific team page
 """
 
 import asyncio
+import hashlib
 import json
 import re
+import string
 from pathlib import Path
 from .base import BaseAction
 from .team_data_extractor import TeamDataExtractor
 from config import config
 from cache_manager import CacheManager
 
+# orjson serializes to bytes in C, several times faster than stdlib json
+# for large payloads; fall back to stdlib when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Pre-compiled patterns for the row-parsing and name-cleanup hot paths:
+# compiled once at import instead of hitting re's internal cache (hash
+# plus lock) on every row
+_USERID_RE = re.compile(r'/member/(\d+)')
+_PCT_RE = re.compile(r'(\d+(?:\.\d+)?)%')
+_NUM_RE = re.compile(r'(\d+(?:\.\d+)?)')
+_TEAM_PREFIX_RE = re.compile(r'^(Team|Member|Player)\s*[-:]?\s*', re.IGNORECASE)
+_TEAM_SUFFIX_RE = re.compile(r'\s*[-:]\s*.*$')
+_TEAM_ID_URL_RE = re.compile(r'/team/(\d+)')
+
+# Navigation/header rejects for the player validator, split the same way
+# as the team validator in extract_player: single-word items reject with
+# one hash lookup, and only the multi-word phrases need a substring scan
+# (an exact check also stops short tokens like 'pa' from rejecting every
+# name that merely contains them)
+_SKIP_EXACT = frozenset({
+    'dashboard', 'matches', 'news', 'events', 'rules', 'store',
+    'discounts', 'contact', 'logout', 'login', 'settings', 'payments',
+    'ac', 'ppm', 'pa'
+})
+_SKIP_PHRASES = (
+    'member services', 'my stats', 'my leagues', 'apa national',
+    'tournament info', 'need help', 'edit profile', 'my membership',
+    'card/id', 'note: this table displays', 'team statistics are not available',
+    'player name', 'skill level', 'matches won/played', 'win %'
+)
+_SKIP_PHRASES_RE = re.compile('|'.join(re.escape(phrase) for phrase in _SKIP_PHRASES))
+
+# Deleting the allowed characters and measuring what's left counts the
+# special characters in one C-level translate instead of a per-char loop
+_DELETE_ALLOWED = str.maketrans('', '', string.ascii_letters + string.digits + string.whitespace)
+
+# The phrase scan runs as a single automaton pass when pyahocorasick is
+# installed; the compiled alternation above is the fallback
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+if ahocorasick is not None:
+    _SKIP_AUTOMATON = ahocorasick.Automaton()
+    for _phrase in _SKIP_PHRASES:
+        _SKIP_AUTOMATON.add_word(_phrase, True)
+    _SKIP_AUTOMATON.make_automaton()
+else:
+    _SKIP_AUTOMATON = None
+
+
+def _matches_skip_phrase(name_lower):
+    """True if any skip phrase occurs in the name, in one pass either way"""
+    if _SKIP_AUTOMATON is not None:
+        return next(_SKIP_AUTOMATON.iter(name_lower), None) is not None
+    return _SKIP_PHRASES_RE.search(name_lower) is not None
+
+# Snapshot of the players table in one round-trip: each row's six cell
+# texts plus the profile link, ready for pure-Python parsing (rows with
+# fewer than six cells are header or filler rows and are dropped
+# client-side)
+# Players-summary row templates, compiled once at module level instead of
+# re-parsing an f-string per player per column
+_PLAYER_ROW_FMT = "{:<20} | {:<10} | {:<10} | {:<11} | {:<18} | {:<6} | {:<6} | {:<6}"
+_PLAYER_ROW_FMT_EXPANDED = _PLAYER_ROW_FMT + " | {:<9} | {:<9} | {:<7}"
+
+
+def _fmt_num(value, width):
+    """Format a numeric stat to one decimal, passing 'N/A' through"""
+    if value != 'N/A' and isinstance(value, (int, float)):
+        return f"{value:.1f}"[:width]
+    return f"{value}"[:width]
+
+_PLAYER_ROWS_JS = """
+() => Array.from(document.querySelectorAll('table tbody tr')).map((tr) => {
+    const tds = tr.querySelectorAll('td');
+    if (tds.length < 6) {
+        return null;
+    }
+    const link = tds[0].querySelector('a');
+    return {
+        name: tds[0].textContent || '',
+        href: link ? link.getAttribute('href') : null,
+        skill: tds[1].textContent || '',
+        matches: tds[2].textContent || '',
+        win_pct: tds[3].textContent || '',
+        ppm: tds[4].textContent || '',
+        pa: tds[5].textContent || ''
+    };
+}).filter((row) => row)
+"""
+
+
 class ExtractTeamAction(BaseAction):
     """Action to extract team statistics from a specific team page"""
     
-    def run(self, team_id=None, output_file=None, format='json', headless=False, terminal_output=True, league=None, expand=False, no_cache=False):
+    def run(self, team_id=None, output_file=None, format='json', headless=False, terminal_output=True, league=None, expand=False, no_cache=False, include_links=False, offline=False):
         """Run the extract team action"""
         print("🚀 APA Stat Scraper - Extract Team")
         
@@ -47,6 +146,8 @@ class ExtractTeamAction(BaseAction):
         self.cache_manager = CacheManager()
         self.no_cache = no_cache
         self.expand = expand
+        self.include_links = include_links
+        self.offline = offline
         
         return self._run_with_session(
             team_url=team_url,
@@ -81,59 +182,57 @@ class ExtractTeamAction(BaseAction):
     async def _run_async(self, team_url, output_file=None, format='json', headless=False, terminal_output=True, expand=False):
         """Async implementation of team extraction"""
         try:
-            # Check cache first (unless --no-cache is specified)
+            # A cache hit validated against the live page leaves the page
+            # already loaded; skip the setup/navigation block in that case
+            page_ready = False
+            
+            # Check cache first (unless --no-cache is specified). Online
+            # runs also consider entries past their TTL: revalidation
+            # decides whether they are still good, so expiry alone no
+            # longer forces a re-extraction
             if not self.no_cache:
                 print("🔍 Checking cache for team data...")
-                cached_data = self.cache_manager.get_cached_data('team', self.team_id, self.league, self.expand)
+                cached_data = self.cache_manager.get_cached_data('team', self.team_id, self.league, self.expand, allow_expired=not self.offline)
+                cache_info = (cached_data or {}).get('_cache_info', {})
+                cached_hash = cache_info.get('content_hash')
+                if cached_data and cache_info.get('expired') and not cached_hash:
+                    # Pre-hash entry past its TTL: nothing to revalidate
+                    # against, so treat it as a miss
+                    cached_data = None
+                
                 if cached_data:
                     print("✅ Found valid cached data!")
-                    print(f"   📅 Cached at: {cached_data.get('_cache_info', {}).get('cached_at', 'Unknown')}")
+                    print(f"   📅 Cached at: {cache_info.get('cached_at', 'Unknown')}")
                     
-                    # Display cached data
-                    if terminal_output:
-                        self._display_team_data_table(cached_data)
-                    else:
-                        self._display_team_data(cached_data)
+                    # Offline runs (and entries written before hashes were
+                    # stored) trust the TTL as before; otherwise compare
+                    # the cached content hash against the live page, which
+                    # lets the TTL stay long without serving stale rosters
+                    if self.offline or not cached_hash:
+                        return await self._deliver_team_data(cached_data, output_file, format, terminal_output)
                     
-                    # Save to file if requested
-                    if output_file:
-                        success = await self._save_team_data(cached_data, output_file, format)
-                        if success:
-                            print(f"💾 Team data saved to: {output_file}")
-                        else:
-                            print("❌ Failed to save team data")
-                            return False
+                    print("🔁 Revalidating cached data against the live page...")
+                    page_ready = await self._prepare_team_page(team_url, headless)
+                    if not page_ready:
+                        return False
                     
-                    return True
+                    live_hash = await self._content_hash()
+                    if live_hash is not None and live_hash == cached_hash:
+                        print("✅ Page content unchanged, using cached data")
+                        # Refresh on read: a confirmed-fresh entry restarts
+                        # its TTL clock
+                        self.cache_manager.refresh_entry('team', self.team_id, self.league, self.expand)
+                        return await self._deliver_team_data(cached_data, output_file, format, terminal_output)
+                    
+                    print("♻️  Page content changed, re-extracting...")
                 else:
                     print("📭 No valid cached data found, proceeding with extraction...")
             else:
                 print("🚫 Cache disabled, proceeding with extraction...")
             
-            # Start browser
-            await self.session_manager.start_browser(headless=headless)
-            
-            # Check if authenticated
-            if not await self.session_manager.is_authenticated():
-                print("❌ No valid session found")
-                print("💡 Run 'python app.py login' to establish a session")
-                return False
-            
-            print("✅ Session found!")
-            
-            # Handle any notifications
-            print("🔍 Checking for notifications...")
-            await self.session_manager.handle_notifications()
-            
-            # Navigate to team page
-            print(f"🌐 Navigating to team page...")
-            print(f"📍 URL: {team_url}")
-            
-            await self.session_manager.page.goto(team_url)
-            await self.session_manager.page.wait_for_load_state('networkidle')
-            
-            # Handle any notifications that might appear
-            await self.session_manager.handle_notifications()
+            if not page_ready:
+                if not await self._prepare_team_page(team_url, headless):
+                    return False
             
             # Extract team data
             print("📊 Extracting team data...")
@@ -151,39 +250,87 @@ class ExtractTeamAction(BaseAction):
             # Cache the extracted data (unless --no-cache is specified)
             if not self.no_cache:
                 print("💾 Caching extracted data...")
+                team_data['content_hash'] = await self._content_hash()
                 cache_success = self.cache_manager.cache_data('team', self.team_id, team_data, self.league, self.expand)
                 if cache_success:
                     print("✅ Data cached successfully")
                 else:
                     print("⚠️ Failed to cache data")
             
-            # Display extracted data
-            if terminal_output:
-                self._display_team_data_table(team_data)
-            else:
-                self._display_team_data(team_data)
-            
-            # Save to file if requested
-            if output_file:
-                success = await self._save_team_data(team_data, output_file, format)
-                if success:
-                    print(f"💾 Team data saved to: {output_file}")
-                else:
-                    print("❌ Failed to save team data")
-                    return False
-            
-            return True
+            return await self._deliver_team_data(team_data, output_file, format, terminal_output)
             
         except Exception as e:
             print(f"❌ Extraction error: {e}")
             return False
     
+    async def _prepare_team_page(self, team_url, headless):
+        """Start the browser and navigate to the team page"""
+        # Start browser
+        await self.session_manager.start_browser(headless=headless)
+        
+        # Check if authenticated
+        if not await self.session_manager.is_authenticated():
+            print("❌ No valid session found")
+            print("💡 Run 'python app.py login' to establish a session")
+            return False
+        
+        print("✅ Session found!")
+        
+        # Handle any notifications
+        print("🔍 Checking for notifications...")
+        await self.session_manager.handle_notifications()
+        
+        # Navigate to team page
+        print(f"🌐 Navigating to team page...")
+        print(f"📍 URL: {team_url}")
+        
+        # domcontentloaded plus a wait keyed to the players table:
+        # networkidle can add seconds of dead time on pages that keep
+        # trickling analytics requests, and the table is what we need
+        await self.session_manager.page.goto(team_url, wait_until='domcontentloaded')
+        try:
+            await self.session_manager.page.wait_for_selector('table tbody tr td', timeout=10000)
+        except Exception:
+            # No table within the timeout; extraction copes with that
+            pass
+        
+        # Handle any notifications that might appear
+        await self.session_manager.handle_notifications()
+        
+        return True
+    
+    async def _content_hash(self):
+        """Hash the players table HTML as a cheap change signal"""
+        try:
+            html = await self.session_manager.page.eval_on_selector('table tbody', 'el => el.outerHTML')
+        except Exception:
+            return None
+        if not html:
+            return None
+        return hashlib.blake2b(html.encode(), digest_size=16).hexdigest()
+    
+    async def _deliver_team_data(self, team_data, output_file, format, terminal_output):
+        """Display team data and optionally save it to a file"""
+        if terminal_output:
+            self._display_team_data_table(team_data)
+        else:
+            self._display_team_data(team_data)
+        
+        if output_file:
+            success = await self._save_team_data(team_data, output_file, format)
+            if success:
+                print(f"💾 Team data saved to: {output_file}")
+            else:
+                print("❌ Failed to save team data")
+                return False
+        
+        return True
+    
     async def _extract_team_data(self):
         """Extract team data from the current page"""
         try:
-            # Wait for page to load completely
-            await self.session_manager.page.wait_for_load_state('networkidle')
-            
+            # The navigation already waited for the players table, so no
+            # extra load-state gate is needed here
             # Get page title and URL for context
             title = await self.session_manager.page.title()
             current_url = self.session_manager.page.url
@@ -207,7 +354,7 @@ class ExtractTeamAction(BaseAction):
                 team_data['team_info']['name'] = team_name
             
             # Extract team ID from URL
-            team_id_match = re.search(r'/team/(\d+)', current_url)
+            team_id_match = _TEAM_ID_URL_RE.search(current_url)
             if team_id_match:
                 team_data['team_info']['team_id'] = team_id_match.group(1)
             
@@ -218,8 +365,10 @@ class ExtractTeamAction(BaseAction):
                 team_data['players'] = players
                 print(f"   ✅ Found {len(players)} player(s)")
             
-            # Extract any additional data we can find
-            additional_data = await self._extract_additional_data()
+            # Extract any additional data we can find; the title and URL
+            # were already fetched above, so pass them down rather than
+            # asking the page again
+            additional_data = await self._extract_additional_data(title, current_url)
             if additional_data:
                 team_data['raw_data'].update(additional_data)
             
@@ -229,37 +378,39 @@ class ExtractTeamAction(BaseAction):
             print(f"❌ Error extracting team data: {e}")
             return None
     
+    # Candidate selectors for the team name, in priority order
+    NAME_SELECTORS = ('h1', 'h2', '.team-name', '.team-title', '[class*="team"]', 'title')
+
     async def _extract_team_name(self):
         """Extract team name from the page"""
         try:
-            # Try multiple selectors for team name
-            name_selectors = [
-                'h1',
-                'h2',
-                '.team-name',
-                '.team-title',
-                '[class*="team"]',
-                'title'
-            ]
-            
-            for selector in name_selectors:
-                try:
-                    element = await self.session_manager.page.query_selector(selector)
-                    if element:
-                        text = await element.text_content()
-                        if text and len(text.strip()) > 0:
-                            # Clean up the text
-                            name = text.strip()
-                            # Remove common prefixes/suffixes
-                            name = re.sub(r'^(Team|Member|Player)\s*[-:]?\s*', '', name, flags=re.IGNORECASE)
-                            name = re.sub(r'\s*[-:]\s*.*$', '', name)  # Remove everything after dash/colon
-                            if len(name) > 2:  # Reasonable name length
-                                return name
-                except:
-                    continue
-            
+            # Probe all candidate selectors client-side and return the
+            # first non-empty text: one round-trip instead of up to two
+            # (query + text read) per selector
+            text = await self.session_manager.page.evaluate(
+                """(selectors) => {
+                    for (const selector of selectors) {
+                        const el = document.querySelector(selector);
+                        if (el && el.textContent && el.textContent.trim().length > 0) {
+                            return el.textContent;
+                        }
+                    }
+                    return null;
+                }""",
+                list(self.NAME_SELECTORS)
+            )
+
+            if text:
+                # Clean up the text
+                name = text.strip()
+                # Remove common prefixes/suffixes
+                name = _TEAM_PREFIX_RE.sub('', name)
+                name = _TEAM_SUFFIX_RE.sub('', name)  # Remove everything after dash/colon
+                if len(name) > 2:  # Reasonable name length
+                    return name
+
             return None
-            
+
         except Exception as e:
             print(f"⚠️ Error extracting team name: {e}")
             return None
@@ -267,112 +418,108 @@ class ExtractTeamAction(BaseAction):
     async def _extract_players(self):
         """Extract players data from the team page"""
         try:
-            players = []
-            
-            # Look for table rows that contain player data
-            table_rows = await self.session_manager.page.query_selector_all('table tbody tr')
-            
-            for i, row in enumerate(table_rows):
-                # Skip header rows (those with 0 cells or th elements)
-                cells = await row.query_selector_all('td')
-                if len(cells) == 0:
-                    continue  # Skip header rows with no td cells
-                    
-                if len(cells) >= 6:  # Should have Player Name, Skill Level, Matches Won/Played, Win %, PPM, PA columns
-                    player_data = await self._extract_player_data_from_row(cells)
-                    if player_data and self._is_valid_player_data(player_data):
-                        players.append(player_data)
-            
-            return players
-            
+            # One evaluate snapshots every row's cell texts and profile
+            # link, so the per-row parsing below is pure Python instead of
+            # several CDP round-trips per cell
+            rows = await self.session_manager.page.evaluate(_PLAYER_ROWS_JS)
+
+            # Bind the parse and validate methods once for the whole batch
+            # rather than resolving them per row
+            parse = self._parse_row_dict
+            is_valid = self._is_valid_player_data
+            parsed = map(parse, rows)
+            return [player for player in parsed if player and is_valid(player)]
+
         except Exception as e:
             print(f"⚠️ Error extracting players: {e}")
             return []
-    
-    async def _extract_player_data_from_row(self, cells):
-        """Extract player data from a table row (array of td elements)"""
+
+    def _parse_row_dict(self, row):
+        """Parse player data out of one snapshotted row dict"""
         try:
-            if len(cells) < 6:
-                return None
-                
             player_data = {}
-            
-            # Cell 0: Player Name, Member ID, and UserId from URL
-            name_cell = await cells[0].text_content()
+
+            # Player Name, Member ID, and UserId from URL
+            name_cell = row.get('name')
             if name_cell:
                 name_text = name_cell.strip()
-                
-                # Extract member ID from patterns like "#19162437" at the end
-                member_id_match = re.search(r'#(\d+)$', name_text)
-                if member_id_match:
-                    player_data['member_id'] = member_id_match.group(1)
-                    # Remove member ID from name
-                    name = re.sub(r'#\d+$', '', name_text).strip()
+
+                # Extract member ID from patterns like "#19162437" at the
+                # end: a rsplit plus isdigit check covers it without the
+                # regex engine
+                name, sep, member_id = name_text.rpartition('#')
+                if sep and member_id.isdigit():
+                    player_data['member_id'] = member_id
+                    name = name.rstrip()
                 else:
                     # No member ID found, use the full text as name
                     name = name_text
-                
+
                 player_data['name'] = name
-                
-                # Extract UserId from the player's URL (if it's a link)
-                try:
-                    # Look for a link within the name cell
-                    link_element = await cells[0].query_selector('a')
-                    if link_element:
-                        href = await link_element.get_attribute('href')
-                        if href:
-                            # Extract UserId from URL pattern like /Philadelphia/member/3287288
-                            userid_match = re.search(r'/member/(\d+)', href)
-                            if userid_match:
-                                player_data['userid'] = userid_match.group(1)
-                except Exception as e:
-                    # If URL extraction fails, continue without userid
-                    pass
-            
-            # Cell 1: Skill Level
-            skill_cell = await cells[1].text_content()
+
+                # Extract UserId from URL pattern like /Philadelphia/member/3287288
+                href = row.get('href')
+                if href:
+                    userid_match = _USERID_RE.search(href)
+                    if userid_match:
+                        player_data['userid'] = userid_match.group(1)
+
+            # Skill Level
+            skill_cell = row.get('skill')
             if skill_cell and skill_cell.strip().isdigit():
                 player_data['skill_level'] = int(skill_cell.strip())
-            
-            # Cell 2: Matches Won/Played (format: "Won/Played")
-            matches_cell = await cells[2].text_content()
+
+            # Matches Won/Played (format: "Won/Played")
+            matches_cell = row.get('matches')
             if matches_cell and '/' in matches_cell:
                 parts = matches_cell.strip().split('/')
                 if len(parts) == 2 and parts[0].isdigit() and parts[1].isdigit():
                     player_data['matches_won'] = int(parts[0])
                     player_data['matches_played'] = int(parts[1])
-            
-            # Cell 3: Win %
-            win_pct_cell = await cells[3].text_content()
-            if win_pct_cell:
-                win_pct_match = re.search(r'(\d+(?:\.\d+)?)%', win_pct_cell)
-                if win_pct_match:
-                    player_data['win_percentage'] = float(win_pct_match.group(1))
-            
-            # Cell 4: PPM (Points Per Match)
-            ppm_cell = await cells[4].text_content()
+
+            # Win %: computed from won/played below when both parsed and
+            # at least one match was played, so the cell only needs parsing
+            # when that recompute won't run — including 0/0 rows, where the
+            # page's own 0% is the only source
+            if not (player_data.get('matches_played') and player_data.get('matches_won') is not None):
+                win_pct_cell = row.get('win_pct')
+                if win_pct_cell:
+                    try:
+                        player_data['win_percentage'] = float(win_pct_cell.strip().rstrip('%'))
+                    except ValueError:
+                        win_pct_match = _PCT_RE.search(win_pct_cell)
+                        if win_pct_match:
+                            player_data['win_percentage'] = float(win_pct_match.group(1))
+
+            # PPM and PA cells are normally bare numbers, so try float()
+            # directly and only fall back to the regex scan on odd input
+            ppm_cell = row.get('ppm')
             if ppm_cell:
-                ppm_match = re.search(r'(\d+(?:\.\d+)?)', ppm_cell)
-                if ppm_match:
-                    player_data['ppm'] = float(ppm_match.group(1))
-            
-            # Cell 5: PA (Points Against)
-            pa_cell = await cells[5].text_content()
+                try:
+                    player_data['ppm'] = float(ppm_cell)
+                except ValueError:
+                    ppm_match = _NUM_RE.search(ppm_cell)
+                    if ppm_match:
+                        player_data['ppm'] = float(ppm_match.group(1))
+
+            pa_cell = row.get('pa')
             if pa_cell:
-                pa_match = re.search(r'(\d+(?:\.\d+)?)', pa_cell)
-                if pa_match:
-                    player_data['pa'] = float(pa_match.group(1))
-            
+                try:
+                    player_data['pa'] = float(pa_cell)
+                except ValueError:
+                    pa_match = _NUM_RE.search(pa_cell)
+                    if pa_match:
+                        player_data['pa'] = float(pa_match.group(1))
+
             # Calculate win percentage if we have played and won
             if player_data.get('matches_played') and player_data.get('matches_won') is not None:
                 played = player_data['matches_played']
                 won = player_data['matches_won']
                 if played > 0:
-                    win_pct = (won / played) * 100
-                    player_data['win_percentage'] = round(win_pct, 1)
-            
+                    player_data['win_percentage'] = round(won / played * 100, 1)
+
             return player_data if player_data.get('name') else None
-            
+
         except Exception as e:
             print(f"⚠️ Error extracting player data from row: {e}")
             return None
@@ -380,70 +527,61 @@ class ExtractTeamAction(BaseAction):
     def _is_valid_player_data(self, player_data):
         """Validate that player data looks legitimate"""
         try:
-            name = player_data.get('name', '')
-            
+            name = player_data.get('name', '').strip()
+
             # Skip if name is too short or looks like navigation
             if len(name) < 3:
                 return False
-            
-            # Skip common navigation elements
-            skip_names = [
-                'member services', 'dashboard', 'matches', 'news', 'events', 'my stats',
-                'rules', 'my leagues', 'apa national', 'store', 'tournament info',
-                'discounts', 'contact', 'need help', 'logout', 'login', 'settings',
-                'edit profile', 'payments', 'my membership', 'card/id', 'ac',
-                'note: this table displays', 'team statistics are not available',
-                'player name', 'skill level', 'matches won/played', 'win %', 'ppm', 'pa'
-            ]
-            
-            name_lower = name.lower()
-            if any(skip in name_lower for skip in skip_names):
-                return False
-            
-            # Skip if it's just a single character or number
-            if len(name.strip()) < 3 or name.strip().isdigit():
+
+            # Skip if it's just a number
+            if name.isdigit():
                 return False
-            
+
             # Skip percentage values
-            if name.strip().endswith('%') or name.strip().replace('.', '').isdigit():
+            if name.endswith('%') or name.replace('.', '').isdigit():
                 return False
-            
-            # Skip if it contains too many special characters
-            special_char_count = sum(1 for c in name if not c.isalnum() and not c.isspace())
-            if special_char_count > len(name) * 0.5:  # More than 50% special chars
+
+            # Skip common navigation elements: exact single-word items are
+            # one set lookup, only the phrases need a substring scan
+            name_lower = name.lower()
+            if name_lower in _SKIP_EXACT:
                 return False
-            
-            return True
+            if _matches_skip_phrase(name_lower):
+                return False
+
+            # Reject names that are more than half special characters:
+            # the translate strips the ASCII bulk in one C pass, and the
+            # Unicode-aware loop only runs over the rare leftovers so
+            # non-Latin names aren't miscounted as special
+            leftover = name.translate(_DELETE_ALLOWED)
+            special = sum(1 for c in leftover if not c.isalnum() and not c.isspace())
+            return special * 2 <= len(name)
             
         except Exception as e:
             print(f"⚠️ Error validating player data: {e}")
             return False
     
-    async def _extract_additional_data(self):
+    async def _extract_additional_data(self, title, current_url):
         """Extract any additional data from the page"""
         try:
             additional_data = {}
-            
-            # Get all links on the page
-            links = await self.session_manager.page.query_selector_all('a[href]')
-            additional_data['links'] = []
-            
-            for link in links:
-                try:
-                    href = await link.get_attribute('href')
-                    text = await link.text_content()
-                    if href and text:
-                        additional_data['links'].append({
-                            'url': href,
-                            'text': text.strip()
-                        })
-                except:
-                    continue
+
+            # The link inventory costs two round-trips per anchor on pages
+            # with hundreds of them and nothing downstream displays or
+            # saves it meaningfully, so it is opt-in; when requested, one
+            # evaluate snapshots every link client-side
+            if self.include_links:
+                additional_data['links'] = await self.session_manager.page.evaluate(
+                    """() => Array.from(document.querySelectorAll('a[href]')).map((a) => ({
+                        url: a.getAttribute('href'),
+                        text: (a.textContent || '').trim()
+                    })).filter((link) => link.url && link.text)"""
+                )
             
             # Get page metadata
             additional_data['page_metadata'] = {
-                'url': self.session_manager.page.url,
-                'title': await self.session_manager.page.title(),
+                'url': current_url,
+                'title': title,
                 'viewport': self.session_manager.page.viewport_size
             }
             
@@ -524,59 +662,57 @@ class ExtractTeamAction(BaseAction):
             # Check if we have expanded data
             has_expanded_data = any(player.get('min_skill') is not None for player in team_data['players'])
             
+            # Build all rows against the precompiled module-level
+            # templates and flush them with a single print: one write
+            # syscall for the whole table instead of one per player
             if has_expanded_data:
-                print("-" * 180)
-                print(f"{'Player Name':<20} | {'Member ID':<10} | {'UserId':<10} | {'Skill Level':<11} | {'Matches Won/Played':<18} | {'Win %':<6} | {'PPM':<6} | {'PA':<6} | {'Min Skill':<9} | {'Max Skill':<9} | {'Seasons':<7}")
-                print("-" * 180)
+                row_fmt = _PLAYER_ROW_FMT_EXPANDED
+                header = row_fmt.format(
+                    'Player Name', 'Member ID', 'UserId', 'Skill Level',
+                    'Matches Won/Played', 'Win %', 'PPM', 'PA',
+                    'Min Skill', 'Max Skill', 'Seasons'
+                )
+                rule = "-" * 180
             else:
-                print("-" * 140)
-                print(f"{'Player Name':<20} | {'Member ID':<10} | {'UserId':<10} | {'Skill Level':<11} | {'Matches Won/Played':<18} | {'Win %':<6} | {'PPM':<6} | {'PA':<6}")
-                print("-" * 140)
-            
+                row_fmt = _PLAYER_ROW_FMT
+                header = row_fmt.format(
+                    'Player Name', 'Member ID', 'UserId', 'Skill Level',
+                    'Matches Won/Played', 'Win %', 'PPM', 'PA'
+                )
+                rule = "-" * 140
+            
+            lines = [rule, header, rule]
             for player in team_data['players']:
-                name = player.get('name', 'Unknown Player')[:19]
-                member_id = player.get('member_id', 'N/A')[:9]
-                userid = player.get('userid', 'N/A')[:9]
-                skill = str(player.get('skill_level', 'N/A'))[:10]
-                
-                # Format matches won/played
-                won = player.get('matches_won', 'N/A')
-                played = player.get('matches_played', 'N/A')
-                if won != 'N/A' and played != 'N/A':
-                    matches = f"{won}/{played}"[:17]
-                else:
-                    matches = f"{won}/{played}"[:17]
+                player_get = player.get
                 
                 # Format win percentage
-                win_pct_val = player.get('win_percentage', 'N/A')
+                win_pct_val = player_get('win_percentage', 'N/A')
                 if win_pct_val != 'N/A' and isinstance(win_pct_val, (int, float)):
                     win_pct = f"{win_pct_val:.1f}%"[:5]
                 else:
                     win_pct = f"{win_pct_val}%"[:5]
                 
-                # Format PPM
-                ppm_val = player.get('ppm', 'N/A')
-                if ppm_val != 'N/A' and isinstance(ppm_val, (int, float)):
-                    ppm = f"{ppm_val:.1f}"[:5]
-                else:
-                    ppm = f"{ppm_val}"[:5]
-                
-                # Format PA
-                pa_val = player.get('pa', 'N/A')
-                if pa_val != 'N/A' and isinstance(pa_val, (int, float)):
-                    pa = f"{pa_val:.1f}"[:5]
-                else:
-                    pa = f"{pa_val}"[:5]
+                fields = [
+                    player_get('name', 'Unknown Player')[:19],
+                    player_get('member_id', 'N/A')[:9],
+                    player_get('userid', 'N/A')[:9],
+                    str(player_get('skill_level', 'N/A'))[:10],
+                    f"{player_get('matches_won', 'N/A')}/{player_get('matches_played', 'N/A')}"[:17],
+                    win_pct,
+                    _fmt_num(player_get('ppm', 'N/A'), 5),
+                    _fmt_num(player_get('pa', 'N/A'), 5)
+                ]
                 
                 if has_expanded_data:
-                    # Format expanded data
-                    min_skill = str(player.get('min_skill', 'N/A'))[:8]
-                    max_skill = str(player.get('max_skill', 'N/A'))[:8]
-                    seasons = str(player.get('seasons_played', 'N/A'))[:6]
-                    
-                    print(f"{name:<20} | {member_id:<10} | {userid:<10} | {skill:<11} | {matches:<18} | {win_pct:<6} | {ppm:<6} | {pa:<6} | {min_skill:<9} | {max_skill:<9} | {seasons:<7}")
-                else:
-                    print(f"{name:<20} | {member_id:<10} | {userid:<10} | {skill:<11} | {matches:<18} | {win_pct:<6} | {ppm:<6} | {pa:<6}")
+                    fields += [
+                        str(player_get('min_skill', 'N/A'))[:8],
+                        str(player_get('max_skill', 'N/A'))[:8],
+                        str(player_get('seasons_played', 'N/A'))[:6]
+                    ]
+                
+                lines.append(row_fmt.format(*fields))
+            
+            print("\n".join(lines))
         
         print("="*80)
     
@@ -616,46 +752,12 @@ class ExtractTeamAction(BaseAction):
         try:
             output_path = Path(output_file)
             
+            # Serialization and the file write are blocking; run them on a
+            # worker thread so the event loop stays free for page work
             if format.lower() == 'json':
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(team_data, f, indent=2, ensure_ascii=False)
+                await asyncio.to_thread(self._write_json, team_data, output_path)
             elif format.lower() == 'csv':
-                # For CSV, we'll create a simple format
-                import csv
-                with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.writer(f)
-                    writer.writerow(['Field', 'Value'])
-                    
-                    # Write basic info
-                    if team_data.get('team_info', {}).get('name'):
-                        writer.writerow(['Team Name', team_data['team_info']['name']])
-                    
-                    if team_data.get('team_info', {}).get('team_id'):
-                        writer.writerow(['Team ID', team_data['team_info']['team_id']])
-                    
-                    # Write players
-                    if team_data.get('players'):
-                        writer.writerow(['', ''])  # Empty row for separation
-                        writer.writerow(['Players', ''])
-                        for i, player in enumerate(team_data['players'], 1):
-                            writer.writerow([f'  Player {i} Name', player.get('name', 'N/A')])
-                            writer.writerow([f'  Player {i} Member ID', player.get('member_id', 'N/A')])
-                            writer.writerow([f'  Player {i} UserId', player.get('userid', 'N/A')])
-                            writer.writerow([f'  Player {i} Skill Level', player.get('skill_level', 'N/A')])
-                            writer.writerow([f'  Player {i} Matches Won', player.get('matches_won', 'N/A')])
-                            writer.writerow([f'  Player {i} Matches Played', player.get('matches_played', 'N/A')])
-                            writer.writerow([f'  Player {i} Win %', player.get('win_percentage', 'N/A')])
-                            writer.writerow([f'  Player {i} PPM', player.get('ppm', 'N/A')])
-                            writer.writerow([f'  Player {i} PA', player.get('pa', 'N/A')])
-                            
-                            # Add expanded data if available
-                            if player.get('min_skill') is not None:
-                                writer.writerow([f'  Player {i} Min Skill', player.get('min_skill', 'N/A')])
-                                writer.writerow([f'  Player {i} Max Skill', player.get('max_skill', 'N/A')])
-                                writer.writerow([f'  Player {i} Seasons Played', player.get('seasons_played', 'N/A')])
-                    
-                    writer.writerow(['URL', team_data.get('url', '')])
-                    writer.writerow(['Extraction Time', team_data.get('extraction_timestamp', '')])
+                await asyncio.to_thread(self._write_csv, team_data, output_path)
             else:
                 print(f"❌ Unsupported format: {format}")
                 return False
@@ -666,29 +768,99 @@ class ExtractTeamAction(BaseAction):
             print(f"❌ Error saving team data: {e}")
             return False
     
+    def _write_json(self, team_data, output_path):
+        """Write team data to a JSON file"""
+        if orjson is not None:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(team_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(team_data, f, indent=2, ensure_ascii=False)
+    
+    def _write_csv(self, team_data, output_path):
+        """Write team data to a CSV file"""
+        # Build all rows up front and hand them to writerows in one call
+        # instead of one writerow per field
+        import csv
+        rows = [('Field', 'Value')]
+        
+        # Basic info
+        team_info = team_data.get('team_info', {})
+        if team_info.get('name'):
+            rows.append(('Team Name', team_info['name']))
+        
+        if team_info.get('team_id'):
+            rows.append(('Team ID', team_info['team_id']))
+        
+        # Players
+        if team_data.get('players'):
+            rows.append(('', ''))  # Empty row for separation
+            rows.append(('Players', ''))
+            for i, player in enumerate(team_data['players'], 1):
+                player_get = player.get
+                rows.append((f'  Player {i} Name', player_get('name', 'N/A')))
+                rows.append((f'  Player {i} Member ID', player_get('member_id', 'N/A')))
+                rows.append((f'  Player {i} UserId', player_get('userid', 'N/A')))
+                rows.append((f'  Player {i} Skill Level', player_get('skill_level', 'N/A')))
+                rows.append((f'  Player {i} Matches Won', player_get('matches_won', 'N/A')))
+                rows.append((f'  Player {i} Matches Played', player_get('matches_played', 'N/A')))
+                rows.append((f'  Player {i} Win %', player_get('win_percentage', 'N/A')))
+                rows.append((f'  Player {i} PPM', player_get('ppm', 'N/A')))
+                rows.append((f'  Player {i} PA', player_get('pa', 'N/A')))
+                
+                # Add expanded data if available
+                if player_get('min_skill') is not None:
+                    rows.append((f'  Player {i} Min Skill', player_get('min_skill', 'N/A')))
+                    rows.append((f'  Player {i} Max Skill', player_get('max_skill', 'N/A')))
+                    rows.append((f'  Player {i} Seasons Played', player_get('seasons_played', 'N/A')))
+        
+        rows.append(('URL', team_data.get('url', '')))
+        rows.append(('Extraction Time', team_data.get('extraction_timestamp', '')))
+        
+        with open(output_path, 'w', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows(rows)
+    
     async def _expand_player_data(self, team_data):
         """Expand player data with detailed statistics by visiting each player's page"""
         try:
             if not team_data.get('players'):
                 return team_data
             
-            print(f"   📊 Processing {len(team_data['players'])} players for detailed statistics...")
-            
-            # Create team data extractor instance
-            team_extractor = TeamDataExtractor(self.session_manager)
-            
-            for i, player in enumerate(team_data['players'], 1):
+            players = team_data['players']
+            total = len(players)
+            print(f"   📊 Processing {total} players for detailed statistics...")
+
+            # Each player expansion is a full page navigation, so the wall
+            # clock is dominated by browser round-trips. Fan the players out
+            # over a small pool of pages in the shared persistent context
+            # (same cookies/session); the pool size bounds concurrency, and
+            # each page is reused for successive players rather than opened
+            # and torn down per player, so the renderer keeps its warm JS
+            # heap and compiled-script cache across navigations. Results are
+            # written into each player dict in place, so order is preserved
+            # without collecting positionally
+            page_pool = asyncio.Queue()
+            for _ in range(min(5, total)):
+                await page_pool.put(await self.session_manager.browser.new_page())
+
+            async def expand_one(i, player):
                 userid = player.get('userid')
                 if not userid:
                     print(f"   ⚠️  Player {i}: No UserId found, skipping expansion")
-                    continue
-                
-                print(f"   🔍 Player {i}/{len(team_data['players'])}: {player.get('name', 'Unknown')} (UserId: {userid})")
-                
+                    return
+
+                print(f"   🔍 Player {i}/{total}: {player.get('name', 'Unknown')} (UserId: {userid})")
+
                 try:
-                    # Use the common team data extractor
-                    player_stats = await team_extractor.extract_player_team_history(userid, self.league)
-                    
+                    page = await page_pool.get()
+                    try:
+                        # Use the common team data extractor on a page of
+                        # its own so navigations don't stomp on each other
+                        team_extractor = TeamDataExtractor(self.session_manager, page=page)
+                        player_stats = await team_extractor.extract_player_team_history(userid, self.league)
+                    finally:
+                        page_pool.put_nowait(page)
+
                     if player_stats:
                         # Add the expanded data to the player
                         player.update(player_stats)
@@ -699,14 +871,20 @@ class ExtractTeamAction(BaseAction):
                         player['min_skill'] = 'N/A'
                         player['max_skill'] = 'N/A'
                         player['seasons_played'] = 'N/A'
-                
+
                 except Exception as e:
                     print(f"   ❌ Error processing {player.get('name', 'Unknown')}: {e}")
                     # Set default values on error
                     player['min_skill'] = 'N/A'
                     player['max_skill'] = 'N/A'
                     player['seasons_played'] = 'N/A'
-            
+
+            try:
+                await asyncio.gather(*(expand_one(i, player) for i, player in enumerate(players, 1)))
+            finally:
+                while not page_pool.empty():
+                    await (await page_pool.get()).close()
+
             print("   ✅ Player data expansion completed")
             return team_data
             
@@ -6,12 +6,52 @@ This module contains shared logic used by both extract-player and extract-team a
 import re
 import asyncio
 
+# Snapshot of every candidate history row's cell texts in one protocol
+# round-trip; deduping by element in the browser replaces the old
+# handle-identity dedupe, which never matched because each
+# query_selector_all call returns fresh handles
+_HISTORY_ROWS_JS = """
+() => {
+    const selectors = [
+        'table tbody tr',
+        'table tr',
+        '.team-row',
+        '.history-row',
+        '[data-testid*="team"]',
+        '[data-testid*="history"]'
+    ];
+    const seen = new Set();
+    const rows = [];
+    for (const selector of selectors) {
+        for (const row of document.querySelectorAll(selector)) {
+            if (!seen.has(row)) {
+                seen.add(row);
+                rows.push(row);
+            }
+        }
+    }
+    return rows.map((row) =>
+        Array.from(row.querySelectorAll('td')).map((td) => (td.textContent || '').trim())
+    );
+}
+"""
+
 
 class TeamDataExtractor:
     """Common team data extraction logic"""
     
-    def __init__(self, session_manager):
+    def __init__(self, session_manager, page=None):
+        """
+        Initialize the extractor
+
+        Args:
+            session_manager: Shared session manager
+            page: Optional dedicated page to drive; defaults to the session
+                  manager's page. Concurrent expansions hand each extractor
+                  its own page so navigations don't stomp on each other.
+        """
         self.session_manager = session_manager
+        self.page = page if page is not None else session_manager.page
     
     async def extract_player_team_history(self, userid, league, max_retries=3):
         """Extract team history for a single player to calculate min_rank, max_rank, seasons_played"""
@@ -24,9 +64,17 @@ class TeamDataExtractor:
                 
                 # Navigate to player's teams page directly
                 teams_url = f"https://league.poolplayers.com/{league}/member/{userid}/teams"
-                await self.session_manager.page.goto(teams_url)
-                await self.session_manager.page.wait_for_load_state('networkidle')
-                await self.session_manager.handle_notifications()
+                # Same targeted wait as the team page: domcontentloaded and
+                # then the table rows, not networkidle
+                await self.page.goto(teams_url, wait_until='domcontentloaded')
+                try:
+                    await self.page.wait_for_selector('table tbody tr td', timeout=10000)
+                except Exception:
+                    pass
+                # Notification handling works on the shared page; dedicated
+                # worker pages skip it rather than poking the wrong page
+                if self.page is self.session_manager.page:
+                    await self.session_manager.handle_notifications()
                 
                 # Add another delay
                 await asyncio.sleep(random.uniform(1, 2))
@@ -118,7 +166,7 @@ class TeamDataExtractor:
         for attempt in range(max_retries):
             try:
                 # Wait a moment for the page to fully load
-                await self.session_manager.page.wait_for_timeout(1000)
+                await self.page.wait_for_timeout(1000)
                 
                 # Look for the Teams tab - try multiple possible selectors
                 teams_tab_selectors = [
@@ -134,7 +182,7 @@ class TeamDataExtractor:
                 
                 for selector in teams_tab_selectors:
                     try:
-                        element = await self.session_manager.page.query_selector(selector)
+                        element = await self.page.query_selector(selector)
                         if element:
                             # Check if it's already active
                             is_active = await element.get_attribute('aria-selected')
@@ -145,8 +193,8 @@ class TeamDataExtractor:
                             await element.click()
                             
                             # Wait for content to load
-                            await self.session_manager.page.wait_for_timeout(2000)
-                            await self.session_manager.page.wait_for_load_state('networkidle')
+                            await self.page.wait_for_timeout(2000)
+                            await self.page.wait_for_load_state('networkidle')
                             
                             return True
                     except Exception as e:
@@ -155,7 +203,7 @@ class TeamDataExtractor:
                 # If no specific Teams tab found, try to find any tab containing "Teams"
                 try:
                     # Look for any element containing "Teams" text that might be clickable
-                    teams_elements = await self.session_manager.page.query_selector_all('*')
+                    teams_elements = await self.page.query_selector_all('*')
                     for element in teams_elements:
                         try:
                             text = await element.text_content()
@@ -163,8 +211,8 @@ class TeamDataExtractor:
                                 tag_name = await element.evaluate('el => el.tagName')
                                 if tag_name.lower() in ['button', 'a', 'div', 'span']:
                                     await element.click()
-                                    await self.session_manager.page.wait_for_timeout(2000)
-                                    await self.session_manager.page.wait_for_load_state('networkidle')
+                                    await self.page.wait_for_timeout(2000)
+                                    await self.page.wait_for_load_state('networkidle')
                                     return True
                         except:
                             continue
@@ -302,7 +350,7 @@ class TeamDataExtractor:
                     print(f"   📜 No new teams found, attempting scroll...")
                     
                     # Scroll to bottom
-                    await self.session_manager.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                    await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
                     await asyncio.sleep(3)  # Wait at least 2 seconds for content to load
                     
                     # Check for "Load More" or "Show More" buttons
@@ -319,7 +367,7 @@ class TeamDataExtractor:
                     load_more_clicked = False
                     for selector in load_more_selectors:
                         try:
-                            load_more_btn = await self.session_manager.page.query_selector(selector)
+                            load_more_btn = await self.page.query_selector(selector)
                             if load_more_btn:
                                 await load_more_btn.click()
                                 await asyncio.sleep(3)  # Wait for content to load
@@ -331,9 +379,9 @@ class TeamDataExtractor:
                     
                     if not load_more_clicked:
                         # No load more button, try scrolling up and down to trigger lazy loading
-                        await self.session_manager.page.evaluate("window.scrollTo(0, 0)")
+                        await self.page.evaluate("window.scrollTo(0, 0)")
                         await asyncio.sleep(2)
-                        await self.session_manager.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                        await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
                         await asyncio.sleep(3)
                     
                     # After scrolling, check if we got any new teams
@@ -368,54 +416,18 @@ class TeamDataExtractor:
         try:
             teams = []
             
-            # Look for table rows that contain team data - try multiple selectors
-            # We need to extract from BOTH "Current Teams" and "Past Teams" sections
-            table_selectors = [
-                'table tbody tr',  # Standard table rows
-                'table tr',        # All table rows
-                '.team-row',
-                '.history-row',
-                '[data-testid*="team"]',
-                '[data-testid*="history"]'
-            ]
-            
-            all_rows = []
-            for selector in table_selectors:
-                rows = await self.session_manager.page.query_selector_all(selector)
-                if rows:
-                    all_rows.extend(rows)
-            
-            # Also specifically look for both "Current Teams" and "Past Teams" sections
-            current_teams_section = await self.session_manager.page.query_selector('div:has-text("Current Teams")')
-            past_teams_section = await self.session_manager.page.query_selector('div:has-text("Past Teams")')
+            # One evaluate returns every row's cell texts, covering both the
+            # "Current Teams" and "Past Teams" sections, so parsing below is
+            # pure Python with no per-cell round-trips
+            cell_rows = await self.page.evaluate(_HISTORY_ROWS_JS)
             
-            if current_teams_section:
-                current_rows = await current_teams_section.query_selector_all('table tbody tr')
-                all_rows.extend(current_rows)
-            
-            if past_teams_section:
-                past_rows = await past_teams_section.query_selector_all('table tbody tr')
-                all_rows.extend(past_rows)
-            
-            # Remove duplicates
-            unique_rows = []
-            seen_rows = set()
-            for row in all_rows:
-                row_id = id(row)
-                if row_id not in seen_rows:
-                    unique_rows.append(row)
-                    seen_rows.add(row_id)
-            
-            for i, row in enumerate(unique_rows):
+            for i, cell_texts in enumerate(cell_rows):
                 if i == 0:  # Skip header row
                     continue
-                    
-                # Extract data from each cell in the row
-                cells = await row.query_selector_all('td')
                 
                 # Handle different table structures
-                if len(cells) >= 2:  # At least 2 cells (team name and some data)
-                    team_data = await self._extract_team_data_from_row_flexible(cells)
+                if len(cell_texts) >= 2:  # At least 2 cells (team name and some data)
+                    team_data = self._extract_team_data_from_row_flexible(cell_texts)
                     
                     if team_data and self._is_valid_team_data(team_data):
                         teams.append(team_data)
@@ -425,16 +437,16 @@ class TeamDataExtractor:
             print(f"⚠️ Error extracting teams from table: {e}")
             return []
 
-    async def _extract_team_data_from_row(self, cells):
-        """Extract team data from a table row (array of td elements) - using exact same logic as extract-player"""
+    def _extract_team_data_from_row(self, cell_texts):
+        """Extract team data from a row's cell texts - using exact same logic as extract-player"""
         try:
-            if len(cells) < 6:
+            if len(cell_texts) < 6:
                 return None
                 
             team_data = {}
             
             # Cell 0: Team name, season, role
-            team_cell = await cells[0].text_content()
+            team_cell = cell_texts[0]
             if team_cell:
                 # The team cell contains: TeamName + Season + Role all concatenated
                 # Example: "All in the GameFall 2025Captain"
@@ -457,31 +469,31 @@ class TeamDataExtractor:
                 team_data['name'] = team_cell.strip()
             
             # Cell 1: Skill Level
-            skill_cell = await cells[1].text_content()
-            if skill_cell and skill_cell.strip().isdigit():
-                team_data['skill_level'] = int(skill_cell.strip())
+            skill_cell = cell_texts[1]
+            if skill_cell.isdigit():
+                team_data['skill_level'] = int(skill_cell)
             
             # Cell 2: Matches Played
-            played_cell = await cells[2].text_content()
-            if played_cell and played_cell.strip().isdigit():
-                team_data['matches_played'] = int(played_cell.strip())
+            played_cell = cell_texts[2]
+            if played_cell.isdigit():
+                team_data['matches_played'] = int(played_cell)
             
             # Cell 3: Matches Won
-            won_cell = await cells[3].text_content()
-            if won_cell and won_cell.strip().isdigit():
-                team_data['matches_won'] = int(won_cell.strip())
+            won_cell = cell_texts[3]
+            if won_cell.isdigit():
+                team_data['matches_won'] = int(won_cell)
             
             # Cell 4: Win Percentage
-            win_pct_cell = await cells[4].text_content()
+            win_pct_cell = cell_texts[4]
             if win_pct_cell:
                 win_pct_match = re.search(r'(\d+\.?\d*)%', win_pct_cell)
                 if win_pct_match:
                     team_data['win_percentage'] = float(win_pct_match.group(1))
             
             # Cell 5: MVP Rank
-            mvp_cell = await cells[5].text_content()
-            if mvp_cell and mvp_cell.strip() != '-':
-                team_data['mvp_rank'] = mvp_cell.strip()
+            mvp_cell = cell_texts[5]
+            if mvp_cell and mvp_cell != '-':
+                team_data['mvp_rank'] = mvp_cell
             
             # Calculate win percentage if we have played and won
             if team_data.get('matches_played') and team_data.get('matches_won') is not None:
@@ -496,23 +508,16 @@ class TeamDataExtractor:
             print(f"⚠️ Error extracting team data from row: {e}")
             return None
 
-    async def _extract_team_data_from_row_flexible(self, cells):
-        """Extract team data from a table row with flexible column handling"""
+    def _extract_team_data_from_row_flexible(self, cell_texts):
+        """Extract team data from a row's cell texts with flexible column handling"""
         try:
             team_data = {}
             
-            # Get all cell text content
-            cell_texts = []
-            for cell in cells:
-                text = await cell.text_content()
-                cell_texts.append(text.strip() if text else '')
-            
-            
             # Handle different table structures
-            if len(cells) >= 6:
+            if len(cell_texts) >= 6:
                 # Standard 6+ column format (Team, Skill, Played, Won, Win%, MVP)
-                return await self._extract_team_data_from_row(cells)
-            elif len(cells) == 2:
+                return self._extract_team_data_from_row(cell_texts)
+            elif len(cell_texts) == 2:
                 # Simple 2-column format - check if first column is a year
                 if cell_texts[0].isdigit() and len(cell_texts[0]) == 4:
                     # First column is year, second is team name
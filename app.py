@@ -6,11 +6,9 @@ Entry point for the command-line interface
 
 import argparse
 import sys
-from actions.login import LoginAction
-from actions.verify_session import VerifySessionAction
-from actions.clear_state import ClearStateAction
-from actions.extract_player import ExtractPlayerAction
-from actions.extract_team import ExtractTeamAction
+# Action classes are imported inside their dispatch branches below so the
+# asyncio/playwright stack only loads for the action that needs it; the
+# cache-manage module is cheap and its parser builder is needed up front
 from actions.cache_manage import CacheManageAction, create_parser as create_cache_manage_parser
 
 def main():
@@ -166,6 +164,16 @@ Examples:
         action='store_true',
         help='Skip cache and force fresh data extraction'
     )
+    extract_team_parser.add_argument(
+        '--include-links',
+        action='store_true',
+        help='Include every page link in the raw extracted data (slower)'
+    )
+    extract_team_parser.add_argument(
+        '--offline',
+        action='store_true',
+        help='Trust cached data without revalidating against the live page'
+    )
     
     # Cache manage action
     create_cache_manage_parser(subparsers)
@@ -174,6 +182,7 @@ Examples:
     
     try:
         if args.action == 'login':
+            from actions.login import LoginAction
             action = LoginAction()
             success = action.run(
                 email=args.email,
@@ -181,12 +190,15 @@ Examples:
                 headless=not args.launch_browser
             )
         elif args.action == 'verify-session':
+            from actions.verify_session import VerifySessionAction
             action = VerifySessionAction()
             success = action.run(headless=not args.launch_browser)
         elif args.action == 'clear-state':
+            from actions.clear_state import ClearStateAction
             action = ClearStateAction()
             success = action.run(confirm=args.confirm)
         elif args.action == 'extract-player':
+            from actions.extract_player import ExtractPlayerAction
             action = ExtractPlayerAction()
             success = action.run(
                 userid=args.userid,
@@ -199,6 +211,7 @@ Examples:
                 no_cache=args.no_cache
             )
         elif args.action == 'extract-team':
+            from actions.extract_team import ExtractTeamAction
             action = ExtractTeamAction()
             success = action.run(
                 team_id=args.team_id,
@@ -208,7 +221,9 @@ Examples:
                 headless=not args.launch_browser,
                 terminal_output=not args.no_terminal,
                 expand=args.expand,
-                no_cache=args.no_cache
+                no_cache=args.no_cache,
+                include_links=args.include_links,
+                offline=args.offline
             )
         elif args.action == 'cache-manage':
             # The cache-manage subparser should have already parsed the subcommand
@@ -13,7 +13,11 @@ from typing import Any, Optional, Dict
 
 class CacheManager:
     """Manages caching of extracted data with timeout functionality"""
-    
+
+    # On-disk index of cache entries, used to answer stats/cleanup queries
+    # without re-reading every cache file
+    INDEX_FILE_NAME = "_index.json"
+
     def __init__(self, cache_dir: str = "var/apa-stat-scraper-2/cache", timeout_hours: int = 12):
         """
         Initialize cache manager
@@ -28,6 +32,9 @@ class CacheManager:
         
         # Ensure cache directory exists
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Memoized stats keyed on the cache directory's identity and mtime
+        self._stats_cache = None
     
     def _generate_cache_key(self, action_type: str, identifier: str, league: str = None, expand: bool = False) -> str:
         """
@@ -81,7 +88,94 @@ class CacheManager:
         except (OSError, ValueError):
             return False
     
-    def get_cached_data(self, action_type: str, identifier: str, league: str = None, expand: bool = False) -> Optional[Dict[str, Any]]:
+    def _index_file_path(self) -> Path:
+        """Get the full path to the on-disk cache index"""
+        return self.cache_dir / self.INDEX_FILE_NAME
+
+    def _iter_cache_files(self):
+        """Iterate cache entry files, excluding the index itself"""
+        for cache_file in self.cache_dir.glob("*.json"):
+            if cache_file.name != self.INDEX_FILE_NAME:
+                yield cache_file
+
+    def _load_index(self) -> Optional[Dict[str, Any]]:
+        """
+        Load the on-disk index if it is still in sync with the cache dir
+
+        Returns:
+            Mapping of filename to entry metadata, or None if the index is
+            missing or stale (the directory changed since it was written)
+        """
+        try:
+            with open(self._index_file_path(), 'r', encoding='utf-8') as f:
+                index = json.load(f)
+
+            if index.get('dir_mtime_ns') != os.stat(self.cache_dir).st_mtime_ns:
+                return None
+
+            entries = index.get('entries')
+            return entries if isinstance(entries, dict) else None
+
+        except (json.JSONDecodeError, OSError, ValueError):
+            return None
+
+    def _write_index(self, entries: Dict[str, Any]) -> None:
+        """Persist the cache index to disk"""
+        try:
+            # Ensure the file exists before recording the directory mtime,
+            # so creating the index cannot invalidate the index itself
+            self._index_file_path().touch(exist_ok=True)
+            dir_mtime_ns = os.stat(self.cache_dir).st_mtime_ns
+
+            with open(self._index_file_path(), 'w', encoding='utf-8') as f:
+                json.dump({'dir_mtime_ns': dir_mtime_ns, 'entries': entries}, f)
+
+        except OSError as e:
+            print(f"⚠️ Error writing cache index: {e}")
+
+    def _invalidate_index(self) -> None:
+        """Drop the on-disk index so it is rebuilt on the next query"""
+        try:
+            self._index_file_path().unlink()
+        except FileNotFoundError:
+            pass
+        except OSError:
+            pass
+
+    def _build_index_entries(self) -> Dict[str, Any]:
+        """Scan the cache dir and build index metadata for every entry"""
+        entries = {}
+
+        for cache_file in self._iter_cache_files():
+            try:
+                file_stat = cache_file.stat()
+
+                try:
+                    with open(cache_file, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                    cache_info = data.get('_cache_info', {})
+                    action_type = cache_info.get('action_type', 'unknown')
+                    expanded = cache_info.get('expanded', False)
+                except (json.JSONDecodeError, OSError):
+                    action_type = 'unknown'
+                    expanded = False
+
+                # Only the mtime is persisted; expiry is computed against
+                # the reading manager's TTL, so an index written under one
+                # timeout_hours doesn't impose it on other managers
+                entries[cache_file.name] = {
+                    'size': file_stat.st_size,
+                    'mtime': file_stat.st_mtime,
+                    'action_type': action_type,
+                    'expanded': expanded
+                }
+
+            except OSError:
+                continue
+
+        return entries
+
+    def get_cached_data(self, action_type: str, identifier: str, league: str = None, expand: bool = False, allow_expired: bool = False) -> Optional[Dict[str, Any]]:
         """
         Retrieve cached data if it exists and is still valid
         
@@ -90,6 +184,9 @@ class CacheManager:
             identifier: Team ID or User ID
             league: League name (optional)
             expand: Whether data was expanded (for team extraction)
+            allow_expired: Also return entries past their TTL (flagged as
+                           expired in _cache_info) so callers that can
+                           revalidate against the source may still use them
             
         Returns:
             Cached data dictionary if valid, None if not found or expired
@@ -97,21 +194,26 @@ class CacheManager:
         cache_key = self._generate_cache_key(action_type, identifier, league, expand)
         cache_file = self._get_cache_file_path(cache_key)
         
-        if not self._is_cache_valid(cache_file):
+        is_valid = self._is_cache_valid(cache_file)
+        if not is_valid and not (allow_expired and cache_file.exists()):
             return None
         
         try:
             with open(cache_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
             
-            # Add cache metadata
+            # Add cache metadata, keeping the content hash recorded at
+            # write time so callers can revalidate against the live page
+            stored_info = data.get('_cache_info', {})
             data['_cache_info'] = {
                 'cached_at': datetime.fromtimestamp(cache_file.stat().st_mtime).isoformat(),
                 'cache_key': cache_key,
                 'action_type': action_type,
                 'identifier': identifier,
                 'league': league,
-                'expanded': expand
+                'expanded': expand,
+                'content_hash': stored_info.get('content_hash'),
+                'expired': not is_valid
             }
             
             return data
@@ -120,6 +222,30 @@ class CacheManager:
             print(f"⚠️ Error reading cache file {cache_file}: {e}")
             return None
     
+    def refresh_entry(self, action_type: str, identifier: str, league: str = None, expand: bool = False) -> bool:
+        """
+        Restart the TTL clock on an entry that was just revalidated
+        
+        Validity is keyed off the file's mtime, so a touch is all a
+        confirmed-fresh entry needs to count as newly cached again.
+        
+        Returns:
+            True if the entry was refreshed, False otherwise
+        """
+        cache_key = self._generate_cache_key(action_type, identifier, league, expand)
+        cache_file = self._get_cache_file_path(cache_key)
+        
+        try:
+            os.utime(cache_file)
+        except OSError:
+            return False
+
+        # The touch changes the entry's mtime but not the directory's, so
+        # the on-disk index would still carry the stale mtime; drop it so
+        # stats and cleanup see the refreshed entry
+        self._invalidate_index()
+        return True
+    
     def cache_data(self, action_type: str, identifier: str, data: Dict[str, Any], league: str = None, expand: bool = False) -> bool:
         """
         Cache extracted data
@@ -146,13 +272,21 @@ class CacheManager:
                 'identifier': identifier,
                 'league': league,
                 'expanded': expand,
-                'timeout_hours': self.timeout_hours
+                'timeout_hours': self.timeout_hours,
+                # Hash of the source content at extraction time, used to
+                # revalidate hits against the live page instead of
+                # trusting the TTL alone
+                'content_hash': data.pop('content_hash', None)
             }
             
             # Write to cache file
             with open(cache_file, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
-            
+
+            # Overwriting an existing entry does not bump the directory
+            # mtime, so drop the index explicitly
+            self._invalidate_index()
+
             return True
             
         except (OSError, ValueError) as e:
@@ -171,13 +305,13 @@ class CacheManager:
             Number of files cleared
         """
         cleared_count = 0
-        
+
         try:
             if action_type and identifier:
                 # Clear specific cache entry (both expanded and unexpanded)
                 cache_key_expanded = self._generate_cache_key(action_type, identifier, expand=True)
                 cache_key_unexpanded = self._generate_cache_key(action_type, identifier, expand=False)
-                
+
                 for cache_key in [cache_key_expanded, cache_key_unexpanded]:
                     cache_file = self._get_cache_file_path(cache_key)
                     if cache_file.exists():
@@ -185,7 +319,7 @@ class CacheManager:
                         cleared_count += 1
             else:
                 # Clear all cache files or files matching action_type
-                for cache_file in self.cache_dir.glob("*.json"):
+                for cache_file in self._iter_cache_files():
                     if action_type is None:
                         # Clear all files
                         cache_file.unlink()
@@ -202,12 +336,39 @@ class CacheManager:
                             # If we can't read the file, delete it anyway
                             cache_file.unlink()
                             cleared_count += 1
-                            
+
+            if cleared_count:
+                self._invalidate_index()
+
         except OSError as e:
             print(f"⚠️ Error clearing cache: {e}")
-        
+
         return cleared_count
     
+    def get_cache_stats_cached(self) -> Dict[str, Any]:
+        """
+        Get cache statistics, memoized on the cache directory's mtime
+
+        Repeated calls return the memoized result in O(1) as long as the
+        cache directory has not changed (adding or removing a cache file
+        bumps the directory mtime, which invalidates the memo).
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        try:
+            dir_stat = os.stat(self.cache_dir)
+            cache_key = (dir_stat.st_mtime_ns, dir_stat.st_ino)
+        except OSError:
+            return self.get_cache_stats()
+
+        if self._stats_cache and self._stats_cache[0] == cache_key:
+            return self._stats_cache[1]
+
+        stats = self.get_cache_stats()
+        self._stats_cache = (cache_key, stats)
+        return stats
+
     def get_cache_stats(self) -> Dict[str, Any]:
         """
         Get statistics about the cache
@@ -228,58 +389,44 @@ class CacheManager:
         }
         
         try:
-            cache_files = list(self.cache_dir.glob("*.json"))
-            stats['total_files'] = len(cache_files)
-            
-            if not cache_files:
+            # Answer from the on-disk index when it is in sync; otherwise
+            # scan the directory once and persist a fresh index
+            entries = self._load_index()
+            if entries is None:
+                entries = self._build_index_entries()
+                self._write_index(entries)
+
+            stats['total_files'] = len(entries)
+
+            if not entries:
                 return stats
-            
+
+            current_time = datetime.now().timestamp()
             file_times = []
-            
-            for cache_file in cache_files:
-                try:
-                    # Get file size
-                    file_size = cache_file.stat().st_size
-                    stats['total_size_bytes'] += file_size
-                    
-                    # Check if valid
-                    if self._is_cache_valid(cache_file):
-                        stats['valid_files'] += 1
-                    else:
-                        stats['expired_files'] += 1
-                    
-                    # Get file modification time
-                    file_mtime = cache_file.stat().st_mtime
-                    file_times.append(file_mtime)
-                    
-                    # Try to get action type and expand status from file content
-                    try:
-                        with open(cache_file, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                        action_type = data.get('_cache_info', {}).get('action_type', 'unknown')
-                        expanded = data.get('_cache_info', {}).get('expanded', False)
-                        
-                        stats['action_types'][action_type] = stats['action_types'].get(action_type, 0) + 1
-                        
-                        if expanded:
-                            stats['expanded_files'] += 1
-                        else:
-                            stats['unexpanded_files'] += 1
-                            
-                    except (json.JSONDecodeError, OSError):
-                        stats['action_types']['unknown'] = stats['action_types'].get('unknown', 0) + 1
-                        
-                except OSError:
-                    # If we can't process this file, continue with the next one
-                    continue
-            
-            if file_times:
-                stats['oldest_file'] = datetime.fromtimestamp(min(file_times)).isoformat()
-                stats['newest_file'] = datetime.fromtimestamp(max(file_times)).isoformat()
-            
+
+            for entry in entries.values():
+                stats['total_size_bytes'] += entry['size']
+                file_times.append(entry['mtime'])
+
+                if current_time < entry['mtime'] + self.timeout_seconds:
+                    stats['valid_files'] += 1
+                else:
+                    stats['expired_files'] += 1
+
+                action_type = entry['action_type']
+                stats['action_types'][action_type] = stats['action_types'].get(action_type, 0) + 1
+
+                if entry['expanded']:
+                    stats['expanded_files'] += 1
+                else:
+                    stats['unexpanded_files'] += 1
+
+            stats['oldest_file'] = datetime.fromtimestamp(min(file_times)).isoformat()
+            stats['newest_file'] = datetime.fromtimestamp(max(file_times)).isoformat()
+
         except OSError as e:
             print(f"⚠️ Error getting cache stats: {e}")
-        
+
         return stats
     
     def cleanup_expired(self) -> int:
@@ -290,14 +437,30 @@ class CacheManager:
             Number of files removed
         """
         removed_count = 0
-        
+
         try:
-            for cache_file in self.cache_dir.glob("*.json"):
-                if not self._is_cache_valid(cache_file):
-                    cache_file.unlink()
-                    removed_count += 1
-                    
+            entries = self._load_index()
+            if entries is None:
+                entries = self._build_index_entries()
+
+            # Single in-memory pass over the index: only expired entries
+            # are touched on disk
+            current_time = datetime.now().timestamp()
+            remaining = {}
+
+            for name, entry in entries.items():
+                if current_time >= entry['mtime'] + self.timeout_seconds:
+                    try:
+                        (self.cache_dir / name).unlink()
+                        removed_count += 1
+                    except FileNotFoundError:
+                        pass
+                else:
+                    remaining[name] = entry
+
+            self._write_index(remaining)
+
         except OSError as e:
             print(f"⚠️ Error cleaning up expired cache: {e}")
-        
+
         return removed_count
\ No newline at end of file